@@ -34,7 +34,6 @@
 #
 from __future__ import annotations
 
-from copy import copy
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, Optional, Type
 
@@ -103,7 +102,7 @@ class Action(object):
         """
         Reconstruct Action object from data retrieved from the db
         """
-        _data = copy(data)  # to not modify caller's data
+        _data = dict(data)  # to not modify caller's data
 
         if '_id' in _data:
             _data['action_id'] = _data.pop('_id')
@@ -50,8 +50,8 @@ class ToUUser(User):
         """
         Check that the provided data dict contains all needed keys.
         """
-        if '_id' not in data or data['_id'] is None:
+        if data.get('_id') is None:
             raise UserMissingData('Attempting to record a ToU acceptance ' 'for an unidentified user.')
-        if 'eduPersonPrincipalName' not in data or data['eduPersonPrincipalName'] is None:
+        if data.get('eduPersonPrincipalName') is None:
             raise UserMissingData('Attempting to record a ToU acceptance ' 'for a user without eppn.')
         return data
@@ -12,7 +12,6 @@ import bson
 import bson.json_util
 from pymongo import MongoClient, ReadPreference
 from pymongo.errors import PyMongoError
-from six import string_types
 
 volunteers = {
     'ft:staging': 'vofaz-tajod',
@@ -53,8 +52,8 @@ class RawDb(object):
         :param collection: Collection name
         :param search_filter: PyMongo search filter
 
-        :type db: string_types
-        :type collection: string_types
+        :type db: str
+        :type collection: str
 
         :rtype: Generator[RawData]
         """
@@ -208,7 +207,7 @@ class RawDb(object):
         """
         The top level path for data logs created by the current run of a db fix script.
         :return: Directory
-        :rtype: string_types
+        :rtype: str
         """
         return os.path.join(self._backupbase, self._myname, self._start_time)
 
@@ -225,8 +224,8 @@ class RawData(object):
     :param collection: Name of collection
 
     :type doc: dict
-    :type db: string_types
-    :type collection: string_types
+    :type db: str
+    :type collection: str
     """
 
     def __init__(self, doc, db, collection):
@@ -250,7 +249,7 @@ class RawData(object):
     def db(self):
         """
         :return: Database name
-        :rtype: string_types
+        :rtype: str
         """
         return self._db
 
@@ -258,18 +257,18 @@ class RawData(object):
     def collection(self):
         """
         :return: Collection name
-        :rtype: string_types
+        :rtype: str
         """
         return self._collection
 
     def pretty(self):
         """
         Format for simple pretty-printing as key: value pairs.
-        :rtype: [string_types]
+        :rtype: [str]
         """
         res = []
         for (key, value) in self.doc.items():
-            if isinstance(value, string_types):
+            if isinstance(value, str):
                 res.extend(['  {!s:>25}: {!s}'.format(key, value.encode('utf-8'))])
             elif isinstance(value, datetime.datetime):
                 res.extend(['  {!s:>25}: {!s}'.format(key, value.isoformat())])
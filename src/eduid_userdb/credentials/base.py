@@ -35,8 +35,9 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type
 
 from eduid_userdb.element import VerifiedElement
 
@@ -61,17 +62,33 @@ class Credential(VerifiedElement):
     proofing_version: Optional[str] = None
 
     def __str__(self):
-        if len(self.key) == 24:
-            # probably an object id in string format, don't cut it
-            shortkey = self.key
-        else:
-            shortkey = self.key[:12]
+        # key is a property that might be costly to compute (e.g. a hash), only fetch it once
+        shortkey = self.key
+        if len(shortkey) != 24:
+            # not an object id in string format, so cut it
+            shortkey = shortkey[:12]
         if self.is_verified:
-            return '<eduID {!s}(key=\'{!s}...\'): verified=True, proofing=({!r} v {!r})>'.format(
-                self.__class__.__name__, shortkey, self.proofing_method, self.proofing_version
+            return (
+                f'<eduID {self.__class__.__name__}(key=\'{shortkey}...\'): verified=True, '
+                f'proofing=({self.proofing_method!r} v {self.proofing_version!r})>'
             )
         else:
-            return '<eduID {!s}(key=\'{!s}...\'): verified=False>'.format(self.__class__.__name__, shortkey)
+            return f'<eduID {self.__class__.__name__}(key=\'{shortkey}...\'): verified=False>'
+
+    @classmethod
+    def _from_dict_transform(cls: Type[Credential], data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transform data received in eduid format into pythonic format.
+        """
+        data = super()._from_dict_transform(data)
+
+        # There are only a handful of different proofing methods and versions, so intern them
+        # to not keep a separate copy of the same string in every credential loaded from the database
+        for key in ('proofing_method', 'proofing_version'):
+            if isinstance(data.get(key), str):
+                data[key] = sys.intern(data[key])
+
+        return data
 
     def _to_dict_transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
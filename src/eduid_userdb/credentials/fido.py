@@ -38,7 +38,7 @@ from dataclasses import dataclass
 from hashlib import sha256
 from typing import Any, Dict, Optional
 
-from eduid_userdb.credentials import Credential
+from eduid_userdb.credentials.base import Credential
 
 __author__ = 'ft'
 
@@ -62,6 +62,21 @@ class FidoCredential(Credential, _FidoCredentialRequired):
 
     description: str = ''
 
+    def _hashed_key(self, data: str) -> str:
+        """
+        Return the hash of keyhandle and data, used as key by the subclasses.
+
+        The hash is cached on the instance together with the strings it was calculated from,
+        so that it is only calculated again if keyhandle or data is changed.
+        """
+        _cached = self.__dict__.get('_cached_key')
+        if _cached is None or _cached[0] is not self.keyhandle or _cached[1] is not data:
+            digest = sha256(self.keyhandle.encode('utf-8'))
+            digest.update(data.encode('utf-8'))
+            _cached = (self.keyhandle, data, 'sha256:' + digest.hexdigest())
+            self.__dict__['_cached_key'] = _cached
+        return _cached[2]
+
 
 @dataclass
 class _U2FCredentialRequired:
@@ -87,7 +102,7 @@ class U2F(FidoCredential, _U2FCredentialRequired):
         """
         Return the element that is used as key.
         """
-        return 'sha256:' + sha256(self.keyhandle.encode('utf-8') + self.public_key.encode('utf-8')).hexdigest()
+        return self._hashed_key(self.public_key)
 
 
 def u2f_from_dict(data: Dict[str, Any]) -> U2F:
@@ -113,7 +128,7 @@ class Webauthn(FidoCredential):
         """
         Return the element that is used as key.
         """
-        return 'sha256:' + sha256(self.keyhandle.encode('utf-8') + self.credential_data.encode('utf-8')).hexdigest()
+        return self._hashed_key(self.credential_data)
 
 
 def webauthn_from_dict(data: Dict[str, Any]) -> Webauthn:
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from bson import ObjectId
 
 from eduid_userdb.credentials.base import Credential
@@ -18,21 +20,10 @@ class CredentialList(ElementList):
     :type credentials: [dict | Password | U2F]
     """
 
+    __slots__ = ()
+
     def __init__(self, creds):
-        elements = []
-        for this in creds:
-            if isinstance(this, Credential):
-                credential = this
-            elif isinstance(this, dict) and 'salt' in this:
-                credential = password_from_dict(this)
-            elif isinstance(this, dict) and 'keyhandle' in this:
-                if 'public_key' in this:
-                    credential = u2f_from_dict(this)
-                else:
-                    credential = webauthn_from_dict(this)
-            else:
-                raise UserHasUnknownData('Unknown credential data (type {}): {!r}'.format(type(this), this))
-            elements.append(credential)
+        elements = [this if isinstance(this, Credential) else _credential_from_dict(this) for this in creds]
 
         ElementList.__init__(self, elements)
 
@@ -46,3 +37,20 @@ class CredentialList(ElementList):
             # backwards compatible - Password.key (credential_id) changed from ObjectId to str
             key = str(key)
         return super(CredentialList, self).find(key)
+
+
+def _credential_from_dict(data: Dict[str, Any]) -> Credential:
+    """
+    Create a Credential instance of the right type from a dict.
+
+    :param data: Credential parameters from database
+    """
+    if not isinstance(data, dict):
+        raise UserHasUnknownData('Unknown credential data (type {}): {!r}'.format(type(data), data))
+    if 'salt' in data:
+        return password_from_dict(data)
+    if 'keyhandle' in data:
+        if 'public_key' in data:
+            return u2f_from_dict(data)
+        return webauthn_from_dict(data)
+    raise UserHasUnknownData('Unknown credential data (type {}): {!r}'.format(type(data), data))
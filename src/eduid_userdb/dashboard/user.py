@@ -33,13 +33,13 @@
 #           Fredrik Thulin <fredrik@thulin.net>
 #
 
-import copy
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Union
 
 import bson
+from pymongo import ReplaceOne
 
 from eduid_userdb import User
 from eduid_userdb.exceptions import UserDBValueError, UserOutOfSync
@@ -71,8 +71,9 @@ class DashboardUser(User):
         """
         if not isinstance(data, dict):
             raise TypeError('letter_proofing_data must be dict, not {!s}'.format(type(data)))
-        old_data = self._data.get('letter_proofing_data', [])
-        self._data['letter_proofing_data'] = old_data + [data]
+        if self.letter_proofing_data is None:
+            self.letter_proofing_data = []
+        self.letter_proofing_data.append(data)
 
 
 class DashboardLegacyUser(object):
@@ -84,6 +85,8 @@ class DashboardLegacyUser(object):
     :type  data: dict
     """
 
+    __slots__ = ('_mongo_doc',)
+
     def __init__(self, data):
         if type(data) is DashboardLegacyUser:
             self._mongo_doc = data._mongo_doc
@@ -102,7 +105,7 @@ class DashboardLegacyUser(object):
     def keys(self):
         return self._mongo_doc.keys()
 
-    def save(self, request, check_sync=True, update_doc=None):
+    def save(self, request, check_sync=True, update_doc=None, now=None):
         '''
         Save the user in MongoDB.
 
@@ -113,14 +116,19 @@ class DashboardLegacyUser(object):
         :param update_doc: if we want to save a doc other that self._mongo_doc.
                            if it is a partial doc, it must carry the '$set' key.
         :type update_doc: dict
+        :param now: timestamp to use as the new modified_ts, to let a caller saving
+                    many users in one request use the same timestamp for all of them.
+                    Defaults to the current time.
+        :type now: datetime | None
         '''
         # Flush out any postalAddress that might exist on really old users.
         # The user will not be parsed by the code in eduid-dashboard-amp if
         # we put postalAddress in profiles documents.
-        if 'postalAddress' in self._mongo_doc:
-            del self._mongo_doc['postalAddress']
+        self._mongo_doc.pop('postalAddress', None)
         modified = self.get_modified_ts()
-        self.set_modified_ts(datetime.utcnow())
+        if now is None:
+            now = datetime.utcnow()
+        self.set_modified_ts(now)
         if update_doc is None:
             update_doc = self._mongo_doc
         test_doc = {'_id': self.get_id()}
@@ -207,6 +215,58 @@ class DashboardLegacyUser(object):
                     )
                     profiles.replace_one({'_id': userid,}, self._mongo_doc)
 
+    @classmethod
+    def retrieve_modified_ts_batch(cls, users, profiles):
+        '''
+        Like retrieve_modified_ts, but for a number of users at once. The profiles are
+        fetched with a single query instead of one query per user.
+
+        :param users: the users to update
+        :type  users: [DashboardLegacyUser]
+        :param profiles: the profiles collection
+        :type  profiles: pymongo.collection.Collection
+        '''
+        # The same user can be passed more than once, so keep all the users for each id
+        by_id = {}
+        for user in users:
+            try:
+                by_id.setdefault(user.get_id(), []).append(user)
+            except UserDBValueError:
+                log.debug("User {!s} has no id, setting modified_ts to None".format(user))
+                user._mongo_doc['modified_ts'] = None
+        if not by_id:
+            return
+
+        found = {}
+        for doc in profiles.find({'_id': {'$in': list(by_id.keys())}}, {'modified_ts': 1}):
+            found[doc['_id']] = doc
+
+        updates = []
+        for userid, id_users in by_id.items():
+            profiles_user = found.get(userid)
+            if profiles_user is None:
+                log.debug(
+                    "User {!s} not found in profiles ({!s}), setting modified_ts to None".format(id_users[0], profiles)
+                )
+                modified_ts = None
+            elif 'modified_ts' in profiles_user:
+                modified_ts = profiles_user['modified_ts']
+            else:
+                # Like retrieve_modified_ts called once per user would, write the first user with a new
+                # modified_ts to profiles and give any other users with the same id that modified_ts
+                modified_ts = datetime.utcnow()
+                id_users[0]._mongo_doc['modified_ts'] = modified_ts
+                log.debug(
+                    "Updating user {!s} in profiles {!s} with new modified_ts: {!s}".format(
+                        id_users[0], profiles, modified_ts
+                    )
+                )
+                updates.append(ReplaceOne({'_id': userid}, id_users[0]._mongo_doc))
+            for user in id_users:
+                user._mongo_doc['modified_ts'] = modified_ts
+        if updates:
+            profiles.bulk_write(updates, ordered=False)
+
     def set_modified_ts(self, ts):
         '''
         Set the timestamp for the last modification of the user.
@@ -357,9 +417,7 @@ class DashboardLegacyUser(object):
 
         :return: bool
         '''
-        if self._mongo_doc.get('norEduPersonNIN', []):
-            return True
-        return False
+        return bool(self._mongo_doc.get('norEduPersonNIN'))
 
     def add_verified_nin(self, verified_nin):
         '''
@@ -368,9 +426,11 @@ class DashboardLegacyUser(object):
         :param verified_nin: the verified NIN
         :type  verified_nin: str
         '''
-        if self.has_nin():
-            self._mongo_doc['norEduPersonNIN'].append(verified_nin)
+        nins = self._mongo_doc.get('norEduPersonNIN')
+        if nins:
+            nins.append(verified_nin)
         else:
+            # also replaces a None value, which setdefault() would not do
             self._mongo_doc['norEduPersonNIN'] = [verified_nin]
 
     def get_addresses(self):
@@ -434,10 +494,9 @@ class DashboardLegacyUser(object):
 
         user_addresses = self.get_addresses()
 
-        for old_address in user_addresses:
+        for idx, old_address in enumerate(user_addresses):
             if old_address.get('type') == 'official':
-                user_addresses.remove(old_address)
-                user_addresses.append(address)
+                user_addresses[idx] = address
                 break
         else:
             user_addresses.append(address)
@@ -483,9 +542,7 @@ class DashboardLegacyUser(object):
         :param mobile: the mobile number to add
         :type  mobile: dict
         '''
-        mobiles = self.get_mobiles()
-        mobiles.append(mobile)
-        self.set_mobiles(mobiles)
+        self._mongo_doc.setdefault('mobile', []).append(mobile)
 
     def add_verified_mobile(self, verified_mobile):
         '''
@@ -519,8 +576,9 @@ class DashboardLegacyUser(object):
         :return: list
         '''
         # Make a copy since caller might manipulate this dict (like adding user_id_hint,
-        # breaking other test cases later on)
-        return copy.deepcopy(self._mongo_doc.get('passwords', []))
+        # breaking other test cases later on). The values in the password dicts are all
+        # immutable (ObjectId, str, datetime), so copying the dicts themselves is enough.
+        return [dict(this) for this in self._mongo_doc.get('passwords', [])]
 
     def set_passwords(self, passwords):
         '''
@@ -1,4 +1,3 @@
-import copy
 import logging
 import warnings
 from typing import Any, Dict, List, Mapping, Optional, Union
@@ -79,7 +78,7 @@ class MongoDB(object):
         :return: db_uri
         """
         if self._sanitized_uri is None:
-            _parsed = copy.copy(self._parsed_uri)
+            _parsed = dict(self._parsed_uri)
             if 'username' in _parsed:
                 _parsed['password'] = 'secret'
             _parsed['nodelist'] = [_parsed['nodelist'][0]]
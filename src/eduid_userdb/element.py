@@ -78,8 +78,7 @@ subclasses.
 """
 from __future__ import annotations
 
-import copy
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
@@ -87,7 +86,10 @@ from eduid_userdb.exceptions import EduIDUserDBError, UserDBValueError
 
 __author__ = 'ft'
 
-from eduid_userdb.util import utc_now
+from eduid_userdb.util import dataclass_field_names, dataclass_fields_to_dict, deepcopy_data, utc_now
+
+# Timestamp used for elements that have no created_ts in the database
+_NO_CREATED_TS = datetime(1900, 1, 1)
 
 
 class ElementError(EduIDUserDBError):
@@ -148,7 +150,8 @@ class Element:
     _no_modified_ts_in_db: bool = False
 
     def __str__(self) -> str:
-        return f'<eduID {self.__class__.__name__}: {asdict(self)}>'
+        values = {name: getattr(self, name) for name in dataclass_field_names(self.__class__)}
+        return f'<eduID {self.__class__.__name__}: {values}>'
 
     @classmethod
     def from_dict(cls: Type[TElementSubclass], data: Dict[str, Any]) -> TElementSubclass:
@@ -158,8 +161,17 @@ class Element:
         if not isinstance(data, dict):
             raise UserDBValueError(f"Invalid data: {data}")
 
-        data = copy.deepcopy(data)  # to not modify callers data
+        data = deepcopy_data(data)  # to not modify callers data
+
+        return cls._from_copied_dict(data)
+
+    @classmethod
+    def _from_copied_dict(cls: Type[TElementSubclass], data: Dict[str, Any]) -> TElementSubclass:
+        """
+        Construct element from a data dict in eduid format, that is already a copy of the callers data.
 
+        Used for elements nested in other elements, that were copied together with their parent.
+        """
         data = cls._from_dict_transform(data)
 
         return cls(**data)
@@ -169,7 +181,8 @@ class Element:
         Convert Element to a dict in eduid format, that can be used to reconstruct the
         Element later.
         """
-        data = asdict(self)
+        # Elements kept in fields (like the ID token of an OidcAuthorization) are serialized in eduid format
+        data = dataclass_fields_to_dict(self)
 
         data = self._to_dict_transform(data)
 
@@ -189,7 +202,7 @@ class Element:
         if 'created_ts' not in data:
             # some really old nin entries in the database have neither created_ts nor modified_ts
             data['_no_created_ts_in_db'] = True
-            data['created_ts'] = datetime.fromisoformat('1900-01-01')
+            data['created_ts'] = _NO_CREATED_TS
 
         if 'modified_ts' not in data:
             data['_no_modified_ts_in_db'] = True
@@ -204,15 +217,12 @@ class Element:
         """
         # If there was no modified_ts in the data that was loaded from the database,
         # don't write one back if it matches the implied one of created_ts
-        if '_no_modified_ts_in_db' in data:
-            if data.pop('_no_modified_ts_in_db') is True:
-                if data.get('modified_ts') == data.get('created_ts'):
-                    del data['modified_ts']
+        if data.pop('_no_modified_ts_in_db', False) is True:
+            if data.get('modified_ts') == data.get('created_ts'):
+                del data['modified_ts']
 
-        if '_no_created_ts_in_db' in data:
-            if data.pop('_no_created_ts_in_db') is True:
-                if 'created_ts' in data:
-                    del data['created_ts']
+        if data.pop('_no_created_ts_in_db', False) is True:
+            data.pop('created_ts', None)
 
         # remove None values
         data = {k: v for k, v in data.items() if v is not None}
@@ -251,8 +261,7 @@ class VerifiedElement(Element):
         if 'verified' in data:
             data['is_verified'] = data.pop('verified')
 
-        if 'verification_code' in data:
-            del data['verification_code']
+        data.pop('verification_code', None)
 
         return data
 
@@ -288,6 +297,14 @@ class PrimaryElement(VerifiedElement):
 
         super().__setattr__(key, value)
 
+    def set_verified(self, value: bool) -> None:
+        """
+        Set the verified status of the element.
+
+        Raises PrimaryElementViolation when trying to set a primary element as unverified.
+        """
+        self.is_verified = value
+
     @classmethod
     def _from_dict_transform(cls: Type[TPrimaryElementSubclass], data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -312,6 +329,9 @@ class PrimaryElement(VerifiedElement):
         return data
 
 
+TElementListSubclass = TypeVar('TElementListSubclass', bound='ElementList')
+
+
 class ElementList(object):
     """
     Hold a list of Element instances.
@@ -321,12 +341,26 @@ class ElementList(object):
     :param elements: List of elements
     """
 
+    __slots__ = ('_elements',)
+
     def __init__(self, elements: List[Element]):
         for this in elements:
             if not isinstance(this, Element):
                 raise ValueError("Not an Element")
+        self._set_elements(elements)
+
+    def _set_elements(self, elements: List[Element]) -> None:
         self._elements = elements
 
+    @classmethod
+    def _from_validated(cls: Type[TElementListSubclass], elements: List[Element]) -> TElementListSubclass:
+        """
+        Create a list from elements taken from an already validated list, without validating them again.
+        """
+        obj = cls.__new__(cls)
+        obj._set_elements(elements)
+        return obj
+
     def __repr__(self):
         return '<eduID {!s}: {!r}>'.format(self.__class__.__name__, getattr(self, '_elements', None))
 
@@ -356,6 +390,8 @@ class ElementList(object):
         :return: Element found, or False if none was found
         :rtype: Element | False
         """
+        # The keys of elements can be changed in place, and callers can modify the list returned by
+        # to_list(), so the elements are always scanned rather than looked up in an index
         res = [x for x in self._elements if x.key == key]
         if len(res) == 1:
             return res[0]
@@ -388,7 +424,10 @@ class ElementList(object):
         if not match:
             raise UserDBValueError("Element not found in list")
 
-        self._elements = [this for this in self._elements if this != match]
+        # Build a new list rather than removing the element in place, since callers might be iterating
+        # over the list returned by to_list() while removing elements. Compare by identity, since
+        # comparing dataclasses by value means comparing all their fields.
+        self._elements = [this for this in self._elements if this is not match]
         return self
 
     def filter(self, cls):
@@ -398,7 +437,7 @@ class ElementList(object):
         :param cls: Class of interest
         :return: ElementList
         """
-        return ElementList([x for x in self._elements if isinstance(x, cls)])
+        return ElementList._from_validated([x for x in self._elements if isinstance(x, cls)])
 
     @property
     def count(self):
@@ -421,6 +460,8 @@ class PrimaryElementList(ElementList):
     :type elements: [dict | Element]
     """
 
+    __slots__ = ()
+
     def __init__(self, elements):
         self._get_primary(elements)
         ElementList.__init__(self, elements)
@@ -445,9 +486,13 @@ class PrimaryElementList(ElementList):
         if self.find(element.key):
             raise DuplicateElementViolation("Element {!s} already in list".format(element.key))
 
-        old_list = self._elements
         ElementList.add(self, element)
-        self._check_primary(old_list)
+        try:
+            self._check_primary()
+        except PrimaryElementViolation:
+            # ElementList.add appends the element in place, so undo that
+            self._elements.pop()
+            raise
         return self
 
     def remove(self, key):
@@ -463,7 +508,12 @@ class PrimaryElementList(ElementList):
         """
         old_list = self._elements
         ElementList.remove(self, key)
-        self._check_primary(old_list)
+        try:
+            self._check_primary()
+        except PrimaryElementViolation:
+            # ElementList.remove replaces the list with a new one, so the old list is still intact
+            self._elements = old_list
+            raise
         return self
 
     @property
@@ -500,23 +550,22 @@ class PrimaryElementList(ElementList):
             raise PrimaryElementViolation("Primary element must be verified")
 
         # Go through the whole list. Mark element as primary and all other as *not* primary.
+        # Only write to the elements that actually change, which is usually just the old and the new primary.
         for this in self._elements:
-            this.is_primary = bool(this.key == key)
+            is_primary = this is match
+            if this.is_primary != is_primary:
+                this.is_primary = is_primary
 
-    def _check_primary(self, old_list):
+    def _check_primary(self):
         """
         If there are confirmed elements, there must be exactly one primary
         element. If there are no confirmed elements, there must be 0 primary
         elements.
 
-        :param old_list: list of elements to get back to if the constraints are violated
-        :type old_list: list
+        Raises PrimaryElementViolation if the constraints are violated. It is up to
+        the caller to undo the change that caused the violation.
         """
-        try:
-            self._get_primary(self._elements)
-        except PrimaryElementViolation:
-            self._elements = copy.copy(old_list)
-            raise
+        self._get_primary(self._elements)
 
     def _get_primary(self, elements):
         """
@@ -530,19 +579,31 @@ class PrimaryElementList(ElementList):
         """
         if not elements:
             return None
-        verified = [x for x in elements if x.is_verified is True]
 
-        if len(verified) == 0:
-            if len([e for e in elements if e.is_primary]) > 0:
+        # Do all the checks in a single pass over the elements
+        primary = None
+        primary_count = 0
+        has_verified = False
+        has_unverified_primary = False
+        for this in elements:
+            if this.is_verified:
+                has_verified = True
+                if this.is_primary:
+                    primary = this
+                    primary_count += 1
+            elif this.is_primary:
+                has_unverified_primary = True
+
+        if not has_verified:
+            if has_unverified_primary:
                 raise PrimaryElementViolation('There are unconfirmed primary elements')
             return None
 
-        res = [x for x in verified if x.is_primary is True]
-        if len(res) != 1:
+        if primary_count != 1:
             raise PrimaryElementViolation(
-                "{!s} contains {!s}/{!s} primary elements".format(self.__class__.__name__, len(res), len(elements))
+                "{!s} contains {!s}/{!s} primary elements".format(self.__class__.__name__, primary_count, len(elements))
             )
-        return res[0]
+        return primary
 
     @property
     def verified(self):
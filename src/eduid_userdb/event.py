@@ -67,8 +67,17 @@ class Event(Element):
 
     @property
     def key(self) -> EventId:
-        """ Return the element that is used as key for events in an ElementList. """
-        return EventId(self.event_id)
+        """
+        Return the element that is used as key for events in an ElementList.
+
+        The key is cached on the instance together with the event_id it was created from,
+        so that the ObjectId only has to be parsed again if event_id is changed.
+        """
+        _cached = self.__dict__.get('_cached_key')
+        if _cached is None or _cached[0] is not self.event_id:
+            _cached = (self.event_id, EventId(self.event_id))
+            self.__dict__['_cached_key'] = _cached
+        return _cached[1]
 
     @classmethod
     def _from_dict_transform(cls: Type[TEventSubclass], data: Dict[str, Any]) -> Dict[str, Any]:
@@ -112,6 +121,8 @@ class EventList(ElementList):
     :param event_class: Enforce all elements are of this type
     """
 
+    __slots__ = ('_event_class',)
+
     def __init__(self, events: list, event_class: Type[Event] = Event):
         self._event_class = event_class
         ElementList.__init__(self, elements=[])
@@ -119,28 +130,51 @@ class EventList(ElementList):
         if not isinstance(events, list):
             raise UserDBValueError('events should be a list')
 
+        if type(self).add is not EventList.add:
+            # Subclasses with their own rules for adding events (like ToUList) get every event through add()
+            for this in events:
+                self.add(self._event_from(this))
+            return
+
+        # Look up the events already added in a dict, rather than searching the list for every event.
+        # Nothing else can modify the list (or the keys of the events in it) while it is being built.
+        added: Dict[EventId, Event] = {}
         for this in events:
-            if isinstance(this, self._event_class):
-                self.add(this)
-            else:
-                event: Event
-                if 'event_type' in this:
-                    event = event_from_dict(this)
-                else:
-                    event = self._event_class.from_dict(this)
-                self.add(event)
+            event = self._event_from(this)
+            if not isinstance(event, self._event_class):
+                raise UserDBValueError("Invalid event: {!r} (expected {!r})".format(event, self._event_class))
+            key = event.key
+            if self._add(event, added.get(key)):
+                added[key] = event
+
+    def _event_from(self, data: Any) -> Event:
+        """ Return the event itself, or create one from a dict in eduid format. """
+        if isinstance(data, self._event_class):
+            return data
+        if 'event_type' in data:
+            return event_from_dict(data)
+        return self._event_class.from_dict(data)
 
     def add(self, event) -> None:
         """ Add an event to the list. """
         if not isinstance(event, self._event_class):
             raise UserDBValueError("Invalid event: {!r} (expected {!r})".format(event, self._event_class))
-        existing = self.find(event.key)
+        self._add(event, self.find(event.key))
+
+    def _add(self, event: Event, existing: Optional[Event]) -> bool:
+        """
+        Add an event to the list, given the event with the same key already in the list (if any).
+
+        :return: True if the event was added, False if it was an identical duplicate
+        """
         if existing:
-            if event.to_dict() == existing.to_dict():
+            # Compare the dataclasses first, since serializing both events is a lot more expensive
+            if event == existing or event.to_dict() == existing.to_dict():
                 # Silently accept duplicate identical events to clean out bad entrys from the database
-                return
+                return False
             raise DuplicateElementViolation("Event {!s} already in list".format(event.key))
         super(EventList, self).add(event)
+        return True
 
     def to_list_of_dicts(self) -> List[Dict[str, Any]]:
         """
@@ -149,6 +183,21 @@ class EventList(ElementList):
         return [this.to_dict() for this in self._elements if isinstance(this, Event)]
 
 
+# Event classes by event_type, populated by the modules defining the event classes
+# (using register_event) to avoid cyclic imports
+_EVENT_CLASSES: Dict[str, Type[Event]] = {}
+
+
+def register_event(event_type: str, event_class: Type[Event]) -> None:
+    """
+    Register the Event subclass to use for events of a certain event_type in event_from_dict.
+
+    :param event_type: Event type, as found in the database
+    :param event_class: Event subclass
+    """
+    _EVENT_CLASSES[event_type] = event_class
+
+
 def event_from_dict(data: Dict[str, Any]):
     """
     Create an Event instance (probably really a subclass of Event) from a dict.
@@ -157,8 +206,7 @@ def event_from_dict(data: Dict[str, Any]):
     """
     if 'event_type' not in data:
         raise UserDBValueError('No event type specified')
-    if data['event_type'] == 'tou_event':
-        from eduid_userdb.tou import ToUEvent  # avoid cyclic dependency by importing this here
-
-        return ToUEvent.from_dict(data=data)
-    raise BadEvent('Unknown event_type in data: {!s}'.format(data['event_type']))
+    event_class = _EVENT_CLASSES.get(data['event_type'])
+    if event_class is None:
+        raise BadEvent('Unknown event_type in data: {!s}'.format(data['event_type']))
+    return event_class.from_dict(data=data)
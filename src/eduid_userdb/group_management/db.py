@@ -135,7 +135,8 @@ class GroupManagementInviteStateDB(BaseDB):
         if check_sync and result.matched_count == 0:
             db_ts = None
             db_state = self._coll.find_one(
-                {'group_scim_id': state.group_scim_id, 'email_address': state.email_address, 'role': state.role}
+                {'group_scim_id': state.group_scim_id, 'email_address': state.email_address, 'role': state.role},
+                {'modified_ts': True},
             )
             if db_state:
                 db_ts = db_state['modified_ts']
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import copy
 import datetime
-from dataclasses import asdict, dataclass, field, fields
+from dataclasses import asdict, dataclass, field
 from enum import Enum, unique
 from typing import Any, Dict, Mapping, Optional
 
 import bson
 
 from eduid_userdb.exceptions import UserDBValueError
+from eduid_userdb.util import dataclass_field_names
 
 __author__ = 'lundberg'
 
@@ -47,8 +48,7 @@ class GroupInviteState:
         if not _data.get('modified_ts'):
             _data['modified_ts'] = None
 
-        field_names = set(f.name for f in fields(cls))
-        _leftovers = [x for x in _data.keys() if x not in field_names]
+        _leftovers = _data.keys() - dataclass_field_names(cls)
         if _leftovers:
             raise UserDBValueError(f'{cls}.from_dict() unknown data: {_leftovers}')
 
@@ -63,6 +63,12 @@ class LockedIdentityNin(LockedIdentityElement, _LockedIdentityNinRequired):
     identity_type: str = 'nin'
 
 
+# Element classes by identity_type, for creating locked identities from dicts
+_LOCKED_IDENTITY_CLASSES: Dict[str, Type[LockedIdentityElement]] = {
+    'nin': LockedIdentityNin,
+}
+
+
 class LockedIdentityList(ElementList):
     """
     Hold a list of LockedIdentityElement instances.
@@ -73,14 +79,18 @@ class LockedIdentityList(ElementList):
     :type locked_identities: [dict | Element]
     """
 
+    __slots__ = ()
+
     def __init__(self, locked_identities):
         elements = []
         for item in locked_identities:
-            if isinstance(item, LockedIdentityElement):
-                elements.append(item)
-            else:
-                if item['identity_type'] == 'nin':
-                    elements.append(LockedIdentityNin.from_dict(item))
+            if not isinstance(item, LockedIdentityElement):
+                element_class = _LOCKED_IDENTITY_CLASSES.get(item['identity_type'])
+                if element_class is None:
+                    # Skip unknown types of locked identities
+                    continue
+                item = element_class.from_dict(item)
+            elements.append(item)
         ElementList.__init__(self, elements)
 
     def remove(self, key):
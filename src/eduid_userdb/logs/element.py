@@ -6,8 +6,6 @@ import logging
 from dataclasses import dataclass, fields
 from typing import Any, Dict, Type, TypeVar
 
-import six
-
 from eduid_userdb.element import Element
 
 __author__ = 'lundberg'
@@ -34,7 +32,7 @@ class LogElement(Element):
         # Check that all keys are accounted for and that no string values are blank
         for key in required_keys:
             data = getattr(self, key)
-            if isinstance(data, six.string_types):
+            if isinstance(data, str):
                 if not data:
                     logger.error('Not enough data to log proofing event: "{}" can not be blank.'.format(key))
                     return False
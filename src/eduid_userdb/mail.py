@@ -46,7 +46,9 @@ class _MailAddressRequired:
     email: str
 
     def __post_init__(self):
-        self.email = self.email.lower()
+        # Addresses loaded from the database are already in lower case, so avoid creating a new string for them
+        if not self.email.islower():
+            self.email = self.email.lower()
 
 
 @dataclass()
@@ -67,9 +69,6 @@ class MailAddress(PrimaryElement, _MailAddressRequired):
         """
         data = super()._from_dict_transform(data)
 
-        if 'added_timestamp' in data:
-            data['created_ts'] = data.pop('added_timestamp')
-
         if 'csrf' in data:
             del data['csrf']
 
@@ -88,15 +87,10 @@ class MailAddressList(PrimaryElementList):
     :type addresses: [dict | MailAddress]
     """
 
+    __slots__ = ()
+
     def __init__(self, addresses):
-        elements = []
-
-        for this in addresses:
-            if isinstance(this, MailAddress):
-                address = this
-            else:
-                address = address_from_dict(this)
-            elements.append(address)
+        elements = [this if isinstance(this, MailAddress) else MailAddress.from_dict(this) for this in addresses]
 
         PrimaryElementList.__init__(self, elements)
 
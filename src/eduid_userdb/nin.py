@@ -68,15 +68,10 @@ class NinList(PrimaryElementList):
     :type nins: [dict | Nin]
     """
 
+    __slots__ = ()
+
     def __init__(self, nins):
-        elements = []
-
-        for this in nins:
-            if isinstance(this, Nin):
-                nin = this
-            else:
-                nin = nin_from_dict(this)
-            elements.append(nin)
+        elements = [this if isinstance(this, Nin) else Nin.from_dict(this) for this in nins]
 
         PrimaryElementList.__init__(self, elements)
 
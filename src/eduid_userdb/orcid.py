@@ -111,20 +111,12 @@ class OidcAuthorization(Element, _OidcAuthorizationRequired):
         # Parse ID token
         _id_token = data.pop('id_token')
         if isinstance(_id_token, dict):
-            data['id_token'] = OidcIdToken.from_dict(_id_token)
+            data['id_token'] = OidcIdToken._from_copied_dict(_id_token)
         elif isinstance(_id_token, OidcIdToken):
             data['id_token'] = _id_token
 
         return data
 
-    def _to_dict_transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        """
-        data = super()._to_dict_transform(data)
-
-        data['id_token'] = self.id_token.to_dict()
-        return data
-
 
 @dataclass
 class _OrcidRequired:
@@ -162,8 +154,8 @@ class Orcid(VerifiedElement, _OrcidRequired):
         # Parse ID token
         _oidc_authz = data.pop('oidc_authz')
         if isinstance(_oidc_authz, dict):
-            data['oidc_authz'] = OidcAuthorization.from_dict(_oidc_authz)
-        if isinstance(_oidc_authz, OidcAuthorization):
+            data['oidc_authz'] = OidcAuthorization._from_copied_dict(_oidc_authz)
+        elif isinstance(_oidc_authz, OidcAuthorization):
             data['oidc_authz'] = _oidc_authz
 
         return data
@@ -171,8 +163,6 @@ class Orcid(VerifiedElement, _OrcidRequired):
     def _to_dict_transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         """
-        data['oidc_authz'] = self.oidc_authz.to_dict()
-
         _has_empty_name = 'name' in data and data['name'] == None
 
         data = super()._to_dict_transform(data)
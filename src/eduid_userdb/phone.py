@@ -62,9 +62,6 @@ class PhoneNumber(PrimaryElement):
         """
         data = super()._from_dict_transform(data)
 
-        if 'added_timestamp' in data:
-            data['created_ts'] = data.pop('added_timestamp')
-
         if 'mobile' in data:
             data['number'] = data.pop('mobile')
 
@@ -86,15 +83,10 @@ class PhoneNumberList(PrimaryElementList):
     :type phones: [dict | PhoneNumber]
     """
 
+    __slots__ = ()
+
     def __init__(self, phones):
-        elements = []
-
-        for this in phones:
-            if isinstance(this, PhoneNumber):
-                phone = this
-            else:
-                phone = phone_from_dict(this)
-            elements.append(phone)
+        elements = [this if isinstance(this, PhoneNumber) else PhoneNumber.from_dict(this) for this in phones]
 
         PrimaryElementList.__init__(self, elements)
 
@@ -41,6 +41,8 @@ class ProfileList(ElementList):
     owner with the same name.
     """
 
+    __slots__ = ()
+
     def __init__(self, profiles: List[Profile]):
         super().__init__(elements=list())
 
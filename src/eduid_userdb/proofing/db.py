@@ -121,7 +121,7 @@ class ProofingStateDB(BaseDB):
         if modified is None:
             # document has never been modified
             result = self._coll.insert_one(state.to_dict())
-            logging.debug(f"{self} Inserted new state {state} into {self._coll_name}): {result.inserted_id})")
+            logger.debug('%s Inserted new state %s into %s: %s', self, state, self._coll_name, result.inserted_id)
         else:
             test_doc = {'eduPersonPrincipalName': state.eppn}
             if check_sync:
@@ -129,17 +129,20 @@ class ProofingStateDB(BaseDB):
             result = self._coll.replace_one(test_doc, state.to_dict(), upsert=(not check_sync))
             if check_sync and result.matched_count == 0:
                 db_ts = None
-                db_state = self._coll.find_one({'eduPersonPrincipalName': state.eppn})
+                db_state = self._coll.find_one({'eduPersonPrincipalName': state.eppn}, {'modified_ts': True})
                 if db_state:
                     db_ts = db_state['modified_ts']
-                logging.error(
-                    f'{self} FAILED Updating state {state} (ts {modified}) in {self._coll_name}). ts in db = {db_ts!s}'
+                logger.error(
+                    '%s FAILED Updating state %s (ts %s) in %s. ts in db = %s',
+                    self,
+                    state,
+                    modified,
+                    self._coll_name,
+                    db_ts,
                 )
                 raise DocumentOutOfSync('Stale state object can\'t be saved')
 
-            logging.debug(
-                "{!s} Updated state {} (ts {}) in {}): {}".format(self, state, modified, self._coll_name, result)
-            )
+            logger.debug('%s Updated state %s (ts %s) in %s: %s', self, state, modified, self._coll_name, result)
 
     def remove_state(self, state):
         """
@@ -113,8 +113,10 @@ class _EmailProofingElementRequired:
     email: str
 
     def __post_init__(self):
-        # Make sure email is lowercase on init as we had trouble with mixed case
-        self.email = self.email.lower()
+        # Make sure email is lowercase on init as we had trouble with mixed case,
+        # but don't create a new string for addresses that are already lower case
+        if not self.email.islower():
+            self.email = self.email.lower()
 
 
 @dataclass
@@ -34,10 +34,10 @@
 
 from __future__ import annotations
 
-import copy
 import datetime
-from dataclasses import asdict, dataclass
-from typing import Mapping, MutableMapping, Optional, Set
+import time
+from dataclasses import dataclass
+from typing import Mapping, MutableMapping, Optional
 
 import bson
 
@@ -48,6 +48,7 @@ from eduid_userdb.proofing.element import (
     PhoneProofingElement,
     SentLetterElement,
 )
+from eduid_userdb.util import dataclass_field_names, dataclass_fields_to_dict
 
 __author__ = 'lundberg'
 
@@ -67,8 +68,10 @@ class ProofingState(object):
             self.id = bson.ObjectId()
 
     @classmethod
-    def _default_from_dict(cls, data: Mapping, fields: Set[str]):
-        _data = copy.deepcopy(dict(data))  # to not modify callers data
+    def _default_from_dict(cls, data: Mapping):
+        # Only top level keys are changed here, so a shallow copy is enough to not modify callers data.
+        # The subclasses have already parsed any elements in data, and those shouldn't be copied again.
+        _data = dict(data)
         if 'eduPersonPrincipalName' in _data:
             _data['eppn'] = _data.pop('eduPersonPrincipalName')
         if '_id' in _data:
@@ -81,8 +84,7 @@ class ProofingState(object):
         if not _data.get('modified_ts'):
             _data['modified_ts'] = None
 
-        fields.update({'id', 'eppn', 'modified_ts'})
-        _leftovers = [x for x in _data.keys() if x not in fields]
+        _leftovers = _data.keys() - dataclass_field_names(cls)
         if _leftovers:
             raise UserDBValueError(f'{cls}.from_dict() unknown data: {_leftovers}')
 
@@ -93,7 +95,8 @@ class ProofingState(object):
         raise NotImplementedError(f'from_dict not implemented for class {cls.__name__}')
 
     def to_dict(self) -> MutableMapping:
-        res = asdict(self)
+        # Elements (like the nin of a NinProofingState) are serialized in eduid format
+        res = dataclass_fields_to_dict(self)
         res['_id'] = res.pop('id')
         res['eduPersonPrincipalName'] = res.pop('eppn')
         if res['modified_ts'] is True:
@@ -118,10 +121,8 @@ class ProofingState(object):
             if self.modified_ts is True or self.modified_ts is None:
                 return False
             raise UserDBValueError(f'Malformed modified_ts: {self.modified_ts!r}')
-        delta = datetime.timedelta(seconds=timeout_seconds)
-        expiry_date = self.modified_ts + delta
-        now = datetime.datetime.now(tz=self.modified_ts.tzinfo)
-        return expiry_date < now
+        # Compare POSIX timestamps rather than constructing timedelta and datetime objects
+        return self.modified_ts.timestamp() + timeout_seconds < time.time()
 
 
 @dataclass()
@@ -131,15 +132,9 @@ class NinProofingState(ProofingState):
 
     @classmethod
     def from_dict(cls, data: Mapping) -> NinProofingState:
-        _data = copy.deepcopy(dict(data))  # to not modify callers data
+        _data = dict(data)  # to not modify callers data, the elements copy their own data in from_dict
         _data['nin'] = NinProofingElement.from_dict(_data['nin'])
-        return cls._default_from_dict(_data, {'nin'})
-
-    def to_dict(self) -> MutableMapping:
-        nin_data = self.nin.to_dict()
-        res = super().to_dict()
-        res['nin'] = nin_data
-        return res
+        return cls._default_from_dict(_data)
 
 
 @dataclass()
@@ -149,16 +144,10 @@ class LetterProofingState(NinProofingState):
 
     @classmethod
     def from_dict(cls, data: Mapping) -> LetterProofingState:
-        _data = copy.deepcopy(dict(data))  # to not modify callers data
+        _data = dict(data)  # to not modify callers data, the elements copy their own data in from_dict
         _data['nin'] = NinProofingElement.from_dict(_data['nin'])
         _data['proofing_letter'] = SentLetterElement.from_dict(_data['proofing_letter'])
-        return cls._default_from_dict(_data, {'nin', 'proofing_letter'})
-
-    def to_dict(self) -> MutableMapping:
-        letter_data = self.proofing_letter.to_dict()
-        res = super().to_dict()
-        res['proofing_letter'] = letter_data
-        return res
+        return cls._default_from_dict(_data)
 
 
 @dataclass()
@@ -169,7 +158,7 @@ class OrcidProofingState(ProofingState):
 
     @classmethod
     def from_dict(cls, data: Mapping) -> OrcidProofingState:
-        return cls._default_from_dict(data, {'state', 'nonce'})
+        return cls._default_from_dict(data)
 
 
 @dataclass()
@@ -181,9 +170,9 @@ class OidcProofingState(NinProofingState):
 
     @classmethod
     def from_dict(cls, data: Mapping) -> OidcProofingState:
-        _data = copy.deepcopy(dict(data))  # to not modify callers data
+        _data = dict(data)  # to not modify callers data, the elements copy their own data in from_dict
         _data['nin'] = NinProofingElement.from_dict(_data['nin'])
-        return cls._default_from_dict(_data, {'nin', 'state', 'nonce', 'token'})
+        return cls._default_from_dict(_data)
 
 
 @dataclass()
@@ -193,15 +182,9 @@ class EmailProofingState(ProofingState):
 
     @classmethod
     def from_dict(cls, data: Mapping) -> EmailProofingState:
-        _data = copy.deepcopy(dict(data))  # to not modify callers data
+        _data = dict(data)  # to not modify callers data, the elements copy their own data in from_dict
         _data['verification'] = EmailProofingElement.from_dict(_data['verification'])
-        return cls._default_from_dict(_data, {'verification'})
-
-    def to_dict(self) -> MutableMapping:
-        email_data = self.verification.to_dict()
-        res = super().to_dict()
-        res['verification'] = email_data
-        return res
+        return cls._default_from_dict(_data)
 
 
 @dataclass()
@@ -211,12 +194,6 @@ class PhoneProofingState(ProofingState):
 
     @classmethod
     def from_dict(cls, data: Mapping) -> PhoneProofingState:
-        _data = copy.deepcopy(dict(data))  # to not modify callers data
+        _data = dict(data)  # to not modify callers data, the elements copy their own data in from_dict
         _data['verification'] = PhoneProofingElement.from_dict(_data['verification'])
-        return cls._default_from_dict(_data, {'verification'})
-
-    def to_dict(self) -> MutableMapping:
-        phone_data = self.verification.to_dict()
-        res = super().to_dict()
-        res['verification'] = phone_data
-        return res
+        return cls._default_from_dict(_data)
@@ -144,7 +144,7 @@ class ResetPasswordStateDB(BaseDB):
             result = self._coll.replace_one(test_doc, state.to_dict(), upsert=(not check_sync))
             if check_sync and result.matched_count == 0:
                 db_ts = None
-                db_state = self._coll.find_one({'eppn': state.eppn})
+                db_state = self._coll.find_one({'eppn': state.eppn}, {'modified_ts': True})
                 if db_state:
                     db_ts = db_state['modified_ts']
                 logging.debug(
@@ -68,7 +68,7 @@ class PasswordResetStateDB(BaseDB):
         :param email_code: Code sent to the user
         :param raise_on_missing: Raise exception if True else return None
 
-        :type email_code: six.string_types
+        :type email_code: str
         :type raise_on_missing: bool
 
         :return: PasswordResetState instance | None
@@ -95,7 +95,7 @@ class PasswordResetStateDB(BaseDB):
         :param eppn: Users unique eppn
         :param raise_on_missing: Raise exception if True else return None
 
-        :type eppn: six.string_types
+        :type eppn: str
         :type raise_on_missing: bool
 
         :return: PasswordResetState instance | None
@@ -146,7 +146,7 @@ class PasswordResetStateDB(BaseDB):
             result = self._coll.replace_one(test_doc, state.to_dict(), upsert=(not check_sync))
             if check_sync and result.matched_count == 0:
                 db_ts = None
-                db_state = self._coll.find_one({'eppn': state.eppn})
+                db_state = self._coll.find_one({'eppn': state.eppn}, {'modified_ts': True})
                 if db_state:
                     db_ts = db_state['modified_ts']
                 logging.debug(
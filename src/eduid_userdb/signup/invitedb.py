@@ -87,7 +87,7 @@ class SignupInviteDB(BaseDB):
             result = self._coll.replace_one(test_doc, invite.to_dict(), upsert=(not check_sync))
             if check_sync and result.matched_count == 0:
                 db_ts = None
-                db_state = self._coll.find_one({'_id': invite.invite_id})
+                db_state = self._coll.find_one({'_id': invite.invite_id}, {'modified_ts': True})
                 if db_state:
                     db_ts = db_state['modified_ts']
                 logging.error(
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from copy import deepcopy
 from typing import List, Optional
 
+from eduid_userdb.util import deepcopy_data
+
 __author__ = 'lundberg'
 
 
@@ -18,7 +19,7 @@ class GenericFilterDict(dict):
         :param data: Data to filter
         :type data: dict
         """
-        _data = deepcopy(data)
+        _data = deepcopy_data(data)
         super(GenericFilterDict, self).__init__()
 
         if _data is None:
@@ -42,8 +43,7 @@ class SupportUserFilter(GenericFilterDict):
     remove_keys = ['_id', 'letter_proofing_data']
 
     def __init__(self, data):
-        _data = deepcopy(data)
-        super(SupportUserFilter, self).__init__(_data)
+        super(SupportUserFilter, self).__init__(data)
 
         self['mailAliases'] = [MailAlias(alias) for alias in self['mailAliases']]
         self['passwords'] = [Credential(password) for password in self['passwords']]
@@ -55,8 +55,7 @@ class SupportSignupUserFilter(GenericFilterDict):
     remove_keys = ['_id', 'letter_proofing_data']
 
     def __init__(self, data):
-        _data = deepcopy(data)
-        super(SupportSignupUserFilter, self).__init__(_data)
+        super(SupportSignupUserFilter, self).__init__(data)
 
         self['mailAliases'] = [MailAlias(alias) for alias in self['mailAliases']]
         self['passwords'] = [Credential(password) for password in self['passwords']]
@@ -78,7 +77,8 @@ class Credential(GenericFilterDict):
     add_keys = ['_id', 'created_by', 'created_ts', 'type', 'success_ts']
 
     def __init__(self, data):
-        _data = deepcopy(data)
+        # Only top level keys are changed here, GenericFilterDict makes the deep copy
+        _data = dict(data)
         # Figure out type of credential
         if 'salt' in _data:
             _data['type'] = 'Password'
@@ -97,7 +97,7 @@ class UserAuthnInfo(GenericFilterDict):
     add_keys = ['success_ts', 'fail_count', 'success_count']
 
     def __init__(self, data):
-        _data = deepcopy(data)
+        _data = deepcopy_data(data)
         # Remove months with 0 failures or successes
         for attrib in ['fail_count', 'success_count']:
             for key, value in data.get(attrib, {}).items():
@@ -121,7 +121,8 @@ class ProofingLogEntry(GenericFilterDict):
     add_keys = ['verified_data', 'created_ts', 'proofing_method', 'proofing_version', 'created_by', 'vetting_by']
 
     def __init__(self, data):
-        _data = deepcopy(data)
+        # Only top level keys are changed here, GenericFilterDict makes the deep copy
+        _data = dict(data)
         # Rename the verified data key to verified_data
         verified_data_names = ['nin', 'mail_address', 'phone_number', 'orcid']
         for name in verified_data_names:
@@ -141,8 +142,7 @@ class UserLetterProofing(GenericFilterDict):
         add_keys = ['sent_ts', 'is_sent', 'address']
 
     def __init__(self, data):
-        _data = deepcopy(data)
-        super(UserLetterProofing, self).__init__(_data)
+        super(UserLetterProofing, self).__init__(data)
         self['nin'] = self.Nin(self['nin'])
         self['proofing_letter'] = self.ProofingLetter(self['proofing_letter'])
 
@@ -155,8 +155,7 @@ class UserOidcProofing(GenericFilterDict):
         add_keys = ['created_ts', 'number']
 
     def __init__(self, data):
-        _data = deepcopy(data)
-        super(UserOidcProofing, self).__init__(_data)
+        super(UserOidcProofing, self).__init__(data)
         self['nin'] = self.Nin(self['nin'])
 
 
@@ -168,8 +167,7 @@ class UserEmailProofing(GenericFilterDict):
         add_keys = ['created_ts', 'email']
 
     def __init__(self, data):
-        _data = deepcopy(data)
-        super(UserEmailProofing, self).__init__(_data)
+        super(UserEmailProofing, self).__init__(data)
         self['verification'] = self.Verification(self['verification'])
 
 
@@ -181,6 +179,5 @@ class UserPhoneProofing(GenericFilterDict):
         add_keys = ['created_ts', 'number']
 
     def __init__(self, data):
-        _data = deepcopy(data)
-        super(UserPhoneProofing, self).__init__(_data)
+        super(UserPhoneProofing, self).__init__(data)
         self['verification'] = self.Verification(self['verification'])
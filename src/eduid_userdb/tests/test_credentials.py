@@ -89,6 +89,14 @@ class TestCredentialList(unittest.TestCase):
         self.assertEqual(token.key, _keyid(_four_dict))
         self.assertEqual(token.public_key, 'foo')
 
+    def test_find_duplicate(self):
+        this = CredentialList([_one_dict, _two_dict, _one_dict])
+        with self.assertRaises(eduid_userdb.exceptions.EduIDUserDBError):
+            this.find('111111111111111111111111')
+
+    def test_find_unknown(self):
+        self.assertFalse(self.four.find('55002741d00690878ae9b603'))
+
     def test_add(self):
         second = self.two.find(ObjectId('222222222222222222222222'))
         self.one.add(second)
@@ -120,6 +128,13 @@ class TestCredentialList(unittest.TestCase):
 
         assert obtained == expected, 'List of credentials with removed credential different than expected'
 
+    def test_remove_and_add(self):
+        this = self.three.remove('333333333333333333333333')
+        self.assertFalse(this.find('333333333333333333333333'))
+        third = Password.from_dict(_three_dict)
+        this.add(third)
+        self.assertEqual(this.find('333333333333333333333333'), third)
+
     def test_remove_unknown(self):
         with self.assertRaises(eduid_userdb.exceptions.UserDBValueError):
             self.one.remove(ObjectId('55002741d00690878ae9b603'))
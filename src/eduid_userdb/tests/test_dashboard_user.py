@@ -1,11 +1,15 @@
 import copy
+from datetime import datetime
 from unittest import TestCase
 
+from bson import ObjectId
+
 from eduid_userdb.credentials import CredentialList
 from eduid_userdb.dashboard import DashboardLegacyUser as User
 from eduid_userdb.dashboard.user import DashboardUser
 from eduid_userdb.exceptions import UserMissingData
 from eduid_userdb.fixtures.users import mocked_user_standard, new_user_example
+from eduid_userdb.testing import MongoTestCase
 
 
 class TestUser(TestCase):
@@ -32,6 +36,89 @@ class TestUser(TestCase):
         user.set_mail_aliases(old_mail_aliases)
         user.set_mail(old_mail)
 
+    def test_add_mobile(self):
+        user = User({})
+        user.add_mobile({'mobile': '+46700011336', 'verified': False})
+        user.add_mobile({'mobile': '+46700011337', 'verified': False})
+        self.assertEqual(
+            user.get_mobiles(),
+            [{'mobile': '+46700011336', 'verified': False}, {'mobile': '+46700011337', 'verified': False}],
+        )
+
+    def test_verify_mobile(self):
+        user = User({'mobile': [{'mobile': '+46700011336', 'verified': False}, {'mobile': '+46700011337'}]})
+        user.add_verified_mobile('+46700011337')
+        self.assertEqual(
+            user.get_mobiles(),
+            [{'mobile': '+46700011336', 'verified': False}, {'mobile': '+46700011337', 'verified': True}],
+        )
+
+        user = User({'mobile': [{'mobile': '+46700011336', 'verified': False}]})
+        user.add_verified_mobile('+46700011336')
+        self.assertEqual(user.get_mobiles(), [{'mobile': '+46700011336', 'verified': True, 'primary': True}])
+
+    def test_verify_duplicates(self):
+        # legacy documents can have duplicate entries, all of them should be verified
+        user = User({'mobile': [{'mobile': '+46700011336'}, {'mobile': '+46700011336'}]})
+        user.add_verified_mobile('+46700011336')
+        self.assertEqual([this['verified'] for this in user.get_mobiles()], [True, True])
+
+        user = User({'mailAliases': [{'email': 'johnsmith@example.com'}, {'email': 'johnsmith@example.com'}]})
+        user.add_verified_email('johnsmith@example.com')
+        self.assertEqual([this['verified'] for this in user.get_mail_aliases()], [True, True])
+
+    def test_add_verified_nin(self):
+        user = User({})
+        user.add_verified_nin('197801011234')
+        user.add_verified_nin('197801011235')
+        self.assertEqual(user.get_nins(), ['197801011234', '197801011235'])
+
+        user = User({'norEduPersonNIN': None})
+        user.add_verified_nin('197801011234')
+        self.assertEqual(user.get_nins(), ['197801011234'])
+
+
+class TestDashboardLegacyUserDB(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.profiles = self.tmp_db.conn['eduid_dashboard']['profiles']
+
+    def test_retrieve_modified_ts_batch(self):
+        ts = datetime(2020, 1, 1)
+        with_ts = ObjectId()
+        without_ts = ObjectId()
+        self.profiles.insert_one({'_id': with_ts, 'mail': 'one@example.com', 'modified_ts': ts})
+        self.profiles.insert_one({'_id': without_ts, 'mail': 'two@example.com'})
+
+        user_with_ts = User({'_id': with_ts})
+        user_without_ts = User({'_id': without_ts, 'mail': 'two@example.com'})
+        user_missing = User({'_id': ObjectId(), 'modified_ts': ts})
+        user_no_id = User({'modified_ts': ts})
+        User.retrieve_modified_ts_batch([user_with_ts, user_without_ts, user_missing, user_no_id], self.profiles)
+
+        self.assertEqual(user_with_ts.get_modified_ts(), ts)
+        self.assertIsNone(user_missing.get_modified_ts())
+        self.assertIsNone(user_no_id.get_modified_ts())
+        # profiles without modified_ts get one
+        self.assertIsInstance(user_without_ts.get_modified_ts(), datetime)
+        doc = self.profiles.find_one({'_id': without_ts})
+        self.assertIsInstance(doc['modified_ts'], datetime)
+        self.assertEqual(doc['mail'], 'two@example.com')
+
+    def test_retrieve_modified_ts_batch_duplicate_ids(self):
+        ts = datetime(2020, 1, 1)
+        with_ts = ObjectId()
+        without_ts = ObjectId()
+        self.profiles.insert_one({'_id': with_ts, 'modified_ts': ts})
+        self.profiles.insert_one({'_id': without_ts})
+
+        users = [User({'_id': with_ts}), User({'_id': with_ts}), User({'_id': without_ts}), User({'_id': without_ts})]
+        User.retrieve_modified_ts_batch(users, self.profiles)
+
+        self.assertEqual([user.get_modified_ts() for user in users[:2]], [ts, ts])
+        self.assertIsInstance(users[2].get_modified_ts(), datetime)
+        self.assertEqual(users[3].get_modified_ts(), users[2].get_modified_ts())
+
 
 class TestPdataUser(TestCase):
     def test_proper_user(self):
@@ -62,3 +149,11 @@ class TestPdataUser(TestCase):
         userdata.pop('eduPersonPrincipalName')
         with self.assertRaises(TypeError):
             DashboardUser.from_dict(userdata)
+
+    def test_add_letter_proofing_data(self):
+        user = DashboardUser.from_dict(data=new_user_example.to_dict())
+        user.add_letter_proofing_data({'number': '197801011234'})
+        user.add_letter_proofing_data({'number': '197801011235'})
+        self.assertEqual(user.letter_proofing_data, [{'number': '197801011234'}, {'number': '197801011235'}])
+        with self.assertRaises(TypeError):
+            user.add_letter_proofing_data(['197801011234'])
@@ -161,3 +161,6 @@ class TestPrimaryElements(TestCase):
         )
         with self.assertRaises(PrimaryElementViolation):
             elem.is_verified = False
+        with self.assertRaises(PrimaryElementViolation):
+            elem.set_verified(False)
+        self.assertTrue(elem.is_verified)
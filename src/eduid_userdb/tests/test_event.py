@@ -69,6 +69,14 @@ class TestEventList(TestCase):
         self.assertIsInstance(match, ToUEvent)
         self.assertEqual(match.version, _one_dict['version'])
 
+    def test_key(self):
+        event = self.one.to_list()[0]
+        self.assertEqual(event.key, _one_dict['id'])
+        self.assertIs(event.key, event.key)
+        new_id = bson.ObjectId()
+        event.event_id = new_id
+        self.assertEqual(event.key, new_id)
+
     def test_add(self):
         second = self.two.to_list()[-1]
         self.one.add(second)
@@ -87,6 +95,16 @@ class TestEventList(TestCase):
         with self.assertRaises(eduid_userdb.element.DuplicateElementViolation):
             self.two.add(dup)
 
+    def test_init_identical_duplicate(self):
+        this = EventList([_one_dict, _two_dict, _two_dict])
+        self.assertEqual(this.to_list_of_dicts(), self.two.to_list_of_dicts())
+
+    def test_init_duplicate_key(self):
+        data = deepcopy(_two_dict)
+        data['version'] = 'other version'
+        with self.assertRaises(eduid_userdb.element.DuplicateElementViolation):
+            EventList([_one_dict, _two_dict, data])
+
     def test_add_event(self):
         third = self.three.to_list()[-1]
         this = EventList([_one_dict, _two_dict, third])
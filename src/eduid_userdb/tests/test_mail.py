@@ -3,6 +3,7 @@ import datetime
 import unittest
 from unittest import TestCase
 
+import eduid_userdb.credentials
 import eduid_userdb.element
 import eduid_userdb.exceptions
 from eduid_userdb.element import Element
@@ -57,6 +58,38 @@ class TestMailAddressList(unittest.TestCase):
         self.assertEqual(match.is_verified, True)
         self.assertEqual(match.verified_ts, None)
 
+    def test_find_after_list_modified(self):
+        self.assertFalse(self.one.find('ft@two.example.org'))
+        # modify the list without going through add()
+        self.one.to_list().append(MailAddress.from_dict(_two_dict))
+        match = self.one.find('ft@two.example.org')
+        self.assertEqual(match.email, 'ft@two.example.org')
+
+    def test_find_after_key_modified(self):
+        match = self.two.find('ft@two.example.org')
+        match.email = 'ft@other.example.org'
+        self.assertFalse(self.two.find('ft@two.example.org'))
+        self.assertEqual(self.two.find('ft@other.example.org'), match)
+
+    def test_find_new_key_after_key_modified(self):
+        self.three.find('ft@two.example.org').email = 'ft@other.example.org'
+        match = self.three.find('ft@other.example.org')
+        self.assertEqual(match.email, 'ft@other.example.org')
+
+    def test_find_after_element_replaced(self):
+        self.assertEqual(self.two.find('ft@two.example.org').email, 'ft@two.example.org')
+        # replace an element without going through add() and remove()
+        self.two.to_list()[1] = MailAddress.from_dict(_three_dict)
+        self.assertFalse(self.two.find('ft@two.example.org'))
+        self.assertEqual(self.two.find('ft@three.example.org').email, 'ft@three.example.org')
+
+    def test_add_duplicate_after_key_modified(self):
+        self.three.find('ft@two.example.org').email = 'ft@other.example.org'
+        dup = MailAddress(email='ft@other.example.org')
+        with self.assertRaises(eduid_userdb.element.DuplicateElementViolation):
+            self.three.add(dup)
+        self.assertEqual(self.three.count, 3)
+
     def test_add(self):
         second = self.two.find('ft@two.example.org')
         self.one.add(second)
@@ -86,6 +119,15 @@ class TestMailAddressList(unittest.TestCase):
         )
         with self.assertRaises(eduid_userdb.element.PrimaryElementViolation):
             self.one.add(new)
+        # the failed add should have been rolled back
+        self.assertEqual(1, self.one.count)
+        self.assertFalse(self.one.find('ft@primary.example.org'))
+
+    def test_remove_primary_rollback(self):
+        with self.assertRaises(eduid_userdb.element.PrimaryElementViolation):
+            self.two.remove('ft@one.example.org')
+        self.assertEqual(2, self.two.count)
+        self.assertEqual('ft@one.example.org', self.two.primary.email)
 
     def test_add_wrong_type(self):
         elemdict = {
@@ -122,6 +164,19 @@ class TestMailAddressList(unittest.TestCase):
     def test_empty_primary(self):
         self.assertEqual(None, self.empty.primary)
 
+    def test_verified(self):
+        verified = self.three.verified
+        self.assertIsInstance(verified, MailAddressList)
+        self.assertEqual(['ft@one.example.org', 'ft@two.example.org'], [x.email for x in verified.to_list()])
+        self.assertEqual(verified.primary, self.three.primary)
+        self.assertEqual(verified.find('ft@two.example.org').email, 'ft@two.example.org')
+        self.assertFalse(verified.find('ft@three.example.org'))
+
+    def test_filter(self):
+        filtered = self.three.filter(MailAddress)
+        self.assertEqual(self.three.to_list(), filtered.to_list())
+        self.assertEqual([], self.three.filter(eduid_userdb.credentials.Password).to_list())
+
     def test_set_primary_to_same(self):
         match = self.one.primary
         self.one.primary = match.email
@@ -195,11 +250,16 @@ class TestMailAddress(TestCase):
         this = self.one.primary
         with self.assertRaises(eduid_userdb.element.PrimaryElementViolation):
             this.is_verified = False
+        with self.assertRaises(eduid_userdb.element.PrimaryElementViolation):
+            this.set_verified(False)
+        self.assertTrue(this.is_verified)
 
     def test_changing_is_verified(self):
         this = self.three.find('ft@three.example.org')
         this.is_verified = False  # was False already
         this.is_verified = True
+        this.set_verified(False)
+        self.assertFalse(this.is_verified)
 
     def test_verified_by(self):
         this = self.three.find('ft@three.example.org')
@@ -183,11 +183,16 @@ class TestNin(TestCase):
         this = self.one.primary
         with self.assertRaises(eduid_userdb.element.PrimaryElementViolation):
             this.is_verified = False
+        with self.assertRaises(eduid_userdb.element.PrimaryElementViolation):
+            this.set_verified(False)
+        self.assertTrue(this.is_verified)
 
     def test_changing_is_verified(self):
         this = self.three.find('197803033456')
         this.is_verified = False  # was False already
         this.is_verified = True
+        this.set_verified(False)
+        self.assertFalse(this.is_verified)
 
     def test_verified_by(self):
         this = self.three.find('197803033456')
@@ -125,3 +125,19 @@ class TestOrcid(unittest.TestCase):
 
         with self.assertRaises(eduid_userdb.exceptions.UserDBValueError):
             Orcid.from_dict(None)
+
+    def test_from_dict_does_not_modify_nested_data(self):
+        token_response['id_token']['created_by'] = 'test'
+        token_response['created_by'] = 'test'
+        orcid = Orcid(
+            id='https://op.example.org/user_orcid',
+            oidc_authz=OidcAuthorization.from_dict(token_response),
+            created_by='test',
+            is_verified=True,
+        )
+        data = orcid.to_dict()
+        expected = orcid.to_dict()
+        Orcid.from_dict(data)
+        self.assertEqual(expected, data)
+        self.assertIn('id_token', token_response)
+        self.assertIn('at_hash', token_response['id_token'])
@@ -3,11 +3,14 @@ from unittest import TestCase
 
 from bson.objectid import ObjectId
 
-from eduid_userdb.credentials import CredentialList
+from eduid_userdb.credentials import CredentialList, Password
+from eduid_userdb.event import EventId
 
 __author__ = 'lundberg'
 
 
+_one_id = ObjectId('55002741d00690878ae9b600')
+
 _one_dict = {
     'id': '55002741d00690878ae9b600',
     'salt': 'firstPasswordElement',
@@ -27,7 +30,7 @@ class TestPassword(TestCase):
         """
         Test that the 'key' property (used by CredentialList) works for the Password.
         """
-        password = self.one.find(ObjectId('55002741d00690878ae9b600'))
+        password = self.one.find(_one_id)
         self.assertEqual(password.key, password.credential_id)
 
     def test_parse_cycle(self):
@@ -39,10 +42,16 @@ class TestPassword(TestCase):
             self.assertEqual(CredentialList(this_dict).to_list_of_dicts(), this.to_list_of_dicts())
 
     def test_created_by(self):
-        this = self.three.find(ObjectId('55002741d00690878ae9b600'))
+        this = self.three.find(_one_id)
         this.created_by = 'unit test'
         self.assertEqual(this.created_by, 'unit test')
 
     def test_created_ts(self):
-        this = self.three.find(ObjectId('55002741d00690878ae9b600'))
+        this = self.three.find(_one_id)
         self.assertIsInstance(this.created_ts, datetime.datetime)
+
+    def test_objectid_subclass_credential_id(self):
+        password = Password(credential_id=EventId('55002741d00690878ae9b603'), salt='objectIdSubclass')
+        self.assertEqual(password.key, '55002741d00690878ae9b603')
+        self.one.add(password)
+        self.assertIs(self.one.find(ObjectId('55002741d00690878ae9b603')), password)
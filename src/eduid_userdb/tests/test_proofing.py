@@ -5,8 +5,9 @@ from datetime import datetime
 from typing import List
 from unittest import TestCase
 
+from eduid_userdb.exceptions import UserDBValueError
 from eduid_userdb.proofing.element import NinProofingElement, SentLetterElement
-from eduid_userdb.proofing.state import LetterProofingState, OidcProofingState, ProofingState
+from eduid_userdb.proofing.state import LetterProofingState, OidcProofingState, OrcidProofingState, ProofingState
 
 __author__ = 'lundberg'
 
@@ -191,3 +192,13 @@ class ProofingStateTest(TestCase):
 
         expired_state = ProofingState(id=None, eppn=EPPN, modified_ts=datetime.now(tz=None))
         self.assertTrue(expired_state.is_expired(-1))
+
+    def test_from_dict_unknown_data(self):
+        data = {'eduPersonPrincipalName': EPPN, 'state': 'state', 'nonce': 'nonce'}
+        state = OrcidProofingState.from_dict(data)
+        self.assertEqual(EPPN, state.eppn)
+        self.assertEqual(state, OrcidProofingState.from_dict(state.to_dict()))
+
+        data['unknown'] = 'test'
+        with self.assertRaises(UserDBValueError):
+            OrcidProofingState.from_dict(data)
@@ -54,6 +54,22 @@ class TestU2F(TestCase):
         this = self.one.find(_keyid(_one_dict))
         self.assertEqual(this.key, _keyid({'keyhandle': this.keyhandle, 'public_key': this.public_key,}))
 
+    def test_key_updated(self):
+        """
+        Test that the cached 'key' property is recalculated when the data it is based on changes.
+        """
+        this = self.one.find(_keyid(_one_dict))
+        this.public_key = 'bar'
+        self.assertEqual(this.key, _keyid({'keyhandle': _one_dict['keyhandle'], 'public_key': 'bar'}))
+        this.keyhandle = 'otherU2FElement'
+        self.assertEqual(this.key, _keyid({'keyhandle': 'otherU2FElement', 'public_key': 'bar'}))
+
+    def test_find_after_key_updated(self):
+        this = self.three.find(_keyid(_one_dict))
+        this.public_key = 'bar'
+        self.assertEqual(self.three.find(_keyid({'keyhandle': _one_dict['keyhandle'], 'public_key': 'bar'})), this)
+        self.assertFalse(self.three.find(_keyid(_one_dict)))
+
     def test_parse_cycle(self):
         """
         Tests that we output something we parsed back into the same thing we output.
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+from unittest import TestCase
+
+from bson import ObjectId
+
+from eduid_userdb.util import deepcopy_data
+
+
+class TestDeepcopyData(TestCase):
+    def test_deepcopy_data(self):
+        data = {
+            '_id': ObjectId(),
+            'created_ts': datetime.utcnow(),
+            'mailAliases': [{'email': 'johnsmith@example.com', 'verified': True}],
+            'nested': {'numbers': [1, 2.0, None, b'bytes'], 'tuple': ({'a': 1},)},
+        }
+        copied = deepcopy_data(data)
+        self.assertEqual(copied, data)
+        self.assertIsNot(copied, data)
+        self.assertIsNot(copied['mailAliases'], data['mailAliases'])
+        self.assertIsNot(copied['mailAliases'][0], data['mailAliases'][0])
+        self.assertIsNot(copied['nested']['numbers'], data['nested']['numbers'])
+        # other types are copied using copy.deepcopy
+        self.assertIsNot(copied['nested']['tuple'][0], data['nested']['tuple'][0])
+        # immutable values are shared
+        self.assertIs(copied['_id'], data['_id'])
+
+        copied['mailAliases'][0]['verified'] = False
+        self.assertTrue(data['mailAliases'][0]['verified'])
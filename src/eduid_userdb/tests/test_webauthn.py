@@ -53,6 +53,14 @@ class TestWebauthn(TestCase):
             ),
         )
 
+    def test_key_updated(self):
+        """
+        Test that the cached 'key' property is recalculated when the data it is based on changes.
+        """
+        this = self.one.find(_keyid(_one_dict))
+        this.credential_data = 'baz'
+        self.assertEqual(this.key, _keyid({'keyhandle': _one_dict['keyhandle'], 'credential_data': 'baz'}))
+
     def test_parse_cycle(self):
         """
         Tests that we output something we parsed back into the same thing we output.
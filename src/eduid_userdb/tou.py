@@ -38,7 +38,7 @@ import datetime
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Type
 
-from eduid_userdb.event import Event, EventList
+from eduid_userdb.event import Event, EventList, register_event
 from eduid_userdb.exceptions import EduIDUserDBError, UserDBValueError
 
 
@@ -78,6 +78,12 @@ class ToUEvent(Event):
         return expiry_date < now
 
 
+register_event('tou_event', ToUEvent)
+
+# All users have implicitly accepted the first ToU version (info stored in another collection)
+_IMPLICITLY_ACCEPTED_VERSIONS = frozenset(['2014-v1', '2014-dev-v1'])
+
+
 class ToUList(EventList):
     """
     List of ToUEvents.
@@ -86,6 +92,8 @@ class ToUList(EventList):
           has_accepted() is the interface to find an ToU event using a version number.
     """
 
+    __slots__ = ()
+
     def __init__(self, events):
         EventList.__init__(self, events, event_class=ToUEvent)
 
@@ -124,8 +132,7 @@ class ToUList(EventList):
         :return: True or False
         :rtype: bool
         """
-        # All users have implicitly accepted the first ToU version (info stored in another collection)
-        if version in ['2014-v1', '2014-dev-v1']:
+        if version in _IMPLICITLY_ACCEPTED_VERSIONS:
             return True
         for this in self.elements:
             if this.version == version and not this.is_expired(interval_seconds=reaccept_interval):
@@ -33,7 +33,6 @@
 #
 from __future__ import annotations
 
-import copy
 import warnings
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
@@ -53,6 +52,7 @@ from eduid_userdb.orcid import Orcid
 from eduid_userdb.phone import PhoneNumberList
 from eduid_userdb.profile import ProfileList
 from eduid_userdb.tou import ToUList
+from eduid_userdb.util import deepcopy_data
 
 TUserSubclass = TypeVar('TUserSubclass', bound='User')
 
@@ -120,7 +120,7 @@ class User(object):
         """
         Construct user from a data dict.
         """
-        data_in = dict(copy.deepcopy(data))  # to not modify callers data
+        data_in = dict(deepcopy_data(data))  # to not modify callers data
 
         data_in = cls.check_or_use_data(data_in)
 
@@ -299,7 +299,7 @@ class UserDB(BaseDB):
             result = self._coll.replace_one(test_doc, user.to_dict(), upsert=(not check_sync))
             if check_sync and result.modified_count == 0:
                 db_ts = None
-                db_user = self._coll.find_one({'_id': user.user_id})
+                db_user = self._coll.find_one({'_id': user.user_id}, {'modified_ts': True})
                 if db_user:
                     db_ts = db_user['modified_ts']
                 logger.debug(
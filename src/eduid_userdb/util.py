@@ -33,7 +33,12 @@
 #
 __author__ = 'ft'
 
+import copy
 import datetime
+from dataclasses import asdict, fields, is_dataclass
+from typing import Any, Dict, Tuple
+
+from bson import ObjectId
 
 
 class UTC(datetime.tzinfo):
@@ -53,3 +58,63 @@ class UTC(datetime.tzinfo):
 def utc_now() -> datetime.datetime:
     """ Return current time with tz=UTC """
     return datetime.datetime.now(tz=datetime.timezone.utc)
+
+
+# Types that are immutable, and thus never have to be copied
+_IMMUTABLE_TYPES = frozenset([str, int, float, bool, bytes, type(None), datetime.datetime, ObjectId])
+
+
+def deepcopy_data(data: Any) -> Any:
+    """
+    Make a deep copy of data as it is loaded from the database (dicts and lists of simple values).
+
+    Dicts and lists are copied recursively, and immutable values are shared with the original.
+    Anything else is handed over to copy.deepcopy, so the result is always a true deep copy. This is
+    a lot faster than copy.deepcopy for the kind of data we get from the database.
+    """
+    _type = type(data)
+    if _type is dict:
+        return {k: deepcopy_data(v) for k, v in data.items()}
+    if _type is list:
+        return [deepcopy_data(v) for v in data]
+    if _type in _IMMUTABLE_TYPES:
+        return data
+    return copy.deepcopy(data)
+
+
+# Cache of the field names of dataclasses, used by dataclass_field_names
+_DATACLASS_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    """
+    Return the names of the fields of a dataclass, in definition order.
+
+    The fields of a class never change, so they are only looked up once per class.
+    """
+    names = _DATACLASS_FIELD_NAMES.get(cls)
+    if names is None:
+        names = tuple(this.name for this in fields(cls))
+        _DATACLASS_FIELD_NAMES[cls] = names
+    return names
+
+
+def dataclass_fields_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Return the fields of a dataclass instance as a dict, without modifying the instance.
+
+    Field values are almost always immutable scalars, so this is a lot cheaper than asdict().
+    Nested dataclasses that have a to_dict() method (like elements) are serialized in eduid format
+    using that, other nested dataclasses using asdict() and anything else is copied using deepcopy_data().
+    """
+    res = {}
+    for name in dataclass_field_names(obj.__class__):
+        value = getattr(obj, name)
+        if type(value) in _IMMUTABLE_TYPES:
+            res[name] = value
+        elif is_dataclass(value) and not isinstance(value, type):
+            _to_dict = getattr(value, 'to_dict', None)
+            res[name] = _to_dict() if _to_dict is not None else asdict(value)
+        else:
+            res[name] = deepcopy_data(value)
+    return res